@@ -33,21 +33,191 @@ Imports symbols from the :mod:`.symbols` module
 """
 
 
+import concurrent.futures
+import hashlib
+import os
+import pickle
+from pathlib import Path
+
+# Ask SymPy to use GMP-backed (gmpy2) integer/rational arithmetic if available:
+#   this must be requested before sympy is first imported.  mpmath likewise
+#   auto-detects gmpy2 at import time (unless MPMATH_NOGMPY is set), which
+#   speeds up every numeric root-selection probe below
+os.environ.setdefault('SYMPY_GROUND_TYPES', 'gmpy')
+try:
+    import gmpy2  # noqa: F401
+except ImportError:
+    pass
+import mpmath  # noqa: F401  (imported after gmpy2 so it binds the GMP backend)
+
 import numpy as np
 import sympy as sy
+try:
+    import symengine as se
+except ImportError:
+    se = None
 from gmplib.utils import e2d
 from gme.symbols import *
+from gme import symbols as gmes
 from sympy import Eq, S, Rational, Reals, N, \
                     pi, sqrt, numer, denom, \
                     simplify, trigsimp, factor, expand, lambdify, collect, \
                     solve, solveset, diff, Matrix, det, \
                     exp, tan, atan, sin, cos, Abs, sign, log, re, im, \
                     integrate, derive_by_array, poly
-from functools import reduce
+from functools import cached_property, lru_cache
 
 __all__ = ['Equations']
 
 
+_sym_cache = {}
+_sym_cache_dir = Path('~/.cache/gme').expanduser()
+
+# Cached derivations depend on this module's code and on SymPy itself, so mix
+#   a fingerprint of both into every disk-cache key: upgrading GME or SymPy
+#   then invalidates stale entries instead of silently reloading them
+try:
+    _code_fingerprint = hashlib.blake2b(
+        Path(__file__).read_bytes() + sy.__version__.encode(),
+        digest_size=16).hexdigest()
+except OSError:
+    _code_fingerprint = sy.__version__
+
+def _cached_sym_op(op_name, op, *args):
+    r"""
+    Apply the SymPy operation `op` to `args`, memoizing the result both in memory
+    and on disk (under `~/.cache/gme/`) keyed on the `srepr` of the arguments.
+    Repeated runs (parameter sweeps, notebook restarts, tests) then skip the slow
+    `simplify`/`factor`/`solve` machinery entirely; since any :math:`\eta`/:math:`\mu`
+    values are already substituted into the argument expressions, they are captured
+    by the key automatically.
+
+    Args:
+        op_name (str): label distinguishing the operation in the cache key
+        op (callable): the SymPy operation, e.g. :func:`simplify` or :func:`solve`
+        args: arguments to pass to `op`
+
+    Returns:
+        the (cached) result of `op(*args)`
+    """
+    key = (op_name, _code_fingerprint) \
+          + tuple(sy.srepr(arg_) if isinstance(arg_, sy.Basic) else repr(arg_)
+                  for arg_ in args)
+    result = _sym_cache.get(key)
+    if result is not None:
+        return result
+    cache_path = _sym_cache_dir/('symop-'+hashlib.blake2b(repr(key).encode()).hexdigest()+'.pkl')
+    if cache_path.exists():
+        try:
+            with open(cache_path,'rb') as file:
+                result = pickle.load(file)
+        except Exception:
+            result = None   # stale/corrupt cache entry: re-evaluate
+    if result is None:
+        result = op(*args)
+        try:
+            _sym_cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(cache_path,'wb') as file:
+                pickle.dump(result, file)
+        except Exception:
+            pass   # cache dir not writable: caching is best-effort only
+    _sym_cache[key] = result
+    return result
+
+def _run_eqn_method(state, method_name):
+    r"""
+    Worker for :meth:`Equations._derive_parallel`: rebuild a bare :class:`Equations`
+    instance from the pickled attribute snapshot `state`, run the named derivation
+    method on it, and return only the attributes that method added.
+
+    Args:
+        state (dict): pickle-safe snapshot of the parent instance's attributes
+        method_name (str): name of the `define_*` method to run
+
+    Returns:
+        dict: the attributes set by the method
+    """
+    eqns = Equations.__new__(Equations)
+    eqns.__dict__.update(state)
+    eqns._e2d_cache = {}
+    getattr(eqns, method_name)()
+    # Exclude worker-private attrs (e.g. the fresh _e2d_cache) so merging
+    #   the result cannot clobber the parent's own private state;
+    #   _gstar_cse_replacements is a genuine product of define_g_eqns
+    return {k_: v_ for k_, v_ in eqns.__dict__.items()
+            if k_ not in state and not callable(v_)
+            and (not k_.startswith('_') or k_=='_gstar_cse_replacements')}
+
+def _cached_simplify(expr):
+    return _cached_sym_op('simplify', simplify, expr)
+
+def _fast_factor(expr):
+    r"""
+    Factor `expr`, delegating to SymEngine's C factorization when the installed
+    bindings provide one (older releases do not), and falling back to SymPy's
+    :func:`factor` otherwise.
+    """
+    if se is not None and hasattr(se, 'factor'):
+        try:
+            return sy.sympify(se.factor(se.sympify(expr)))
+        except Exception:
+            pass   # e.g. relational/matrix input the bindings cannot handle
+    return factor(expr)
+
+def _cached_factor(expr):
+    return _cached_sym_op('factor', _fast_factor, expr)
+
+def _cached_solve(*args):
+    return _cached_sym_op('solve', solve, *args)
+
+def _hornerize(expr, var):
+    r"""
+    Rewrite the polynomial-in-`var` sums inside `expr` in Horner form, which
+    evaluates with n multiplies and adds instead of explicit powers — worth
+    doing just before code generation. Non-polynomial subtrees are left alone.
+    """
+    def horner_(node):
+        try:
+            return sy.horner(node, var)
+        except Exception:   # e.g. fractional or symbolic powers of var
+            return node
+    return expr.replace(lambda node: node.is_Add and node.is_polynomial(var), horner_)
+
+# Trig identities shared by the geodesic and initial-boundary derivations
+_cosbeta_eqn = Eq(cos(beta), 1/sqrt(1+tan(beta)**2))
+_sinbeta_eqn = Eq(sin(beta), sqrt(1-1/(1+tan(beta)**2)))
+_sintwobeta_eqn = Eq(sin(2*beta), cos(beta)**2-sin(beta)**2)
+
+@lru_cache(maxsize=None)
+def _boundary_eqns():
+    r"""
+    Build the initial-boundary-profile equations (and their gradients) for the
+    three `ibc_type` choices. They involve only module-level symbols, so the
+    result is built once and shared across :class:`Equations` instances.
+    """
+    boundary_eqns = {
+        'planar' : {'h': Eq(h, (h_0*x/x_1))},
+        'convex-up' : {'h': simplify(Eq(h, h_0*sy.tanh(kappa_h*x/x_1)/sy.tanh(kappa_h/x_1)))},
+        'concave-up' : {'h': simplify(Eq(h, h_0+h_0*sy.tanh(-kappa_h*(x_1-x)/x_1)/sy.tanh(kappa_h/x_1)))}
+    }
+    # Math concave-up not geo concave-up, i.e., with minimum
+    # Math convex-up not geo convex-up, i.e., with maximum
+    for ibc_type in ['planar','convex-up','concave-up']:
+        boundary_eqns[ibc_type].update({
+            'gradh': Eq(diff(h_fn,x),diff(boundary_eqns[ibc_type]['h'].rhs,x))
+            })
+    return boundary_eqns
+
+try:
+    # Rewrites Pow(b, n) for small integer n as repeated multiplication in the
+    #   generated code (n-1 multiplies instead of a pow call); the rewrite is
+    #   kept unevaluated so SymPy does not immediately re-collapse it
+    from sympy.codegen.rewriting import create_expand_pow_optimization
+    _expand_small_powers = create_expand_pow_optimization(6)
+except ImportError:
+    _expand_small_powers = lambda expr: expr
+
+
 class Equations:
     r"""
     Class to solve the set of GME equations (using :mod:`SymPy <sympy>`)
@@ -64,7 +234,8 @@ class Equations:
     """
     def __init__( self, parameters=None, eta=Rational(3,2), mu=Rational(3,4),
                   beta_type='sin', varphi_type='ramp', ibc_type='convex-up',
-                  do_raw=False, do_idtx=False, do_geodesic=False, do_nothing=False ):
+                  do_raw=False, do_idtx=False, do_geodesic=False, do_nothing=False,
+                  use_cache=True ):
         """
         Initialize class instance.
         Define/derive all the GME equations (unless `'do_nothing'` is true) using :mod:`SymPy <sympy>`.
@@ -80,6 +251,7 @@ class Equations:
             do_idtx (bool): generate indicatrix and figuratrix equations?
             do_geodesic (bool): generate geodesic equations?
             do_nothing (bool): just create the class instance and set its data, but don't run any of the equation definition methods
+            use_cache (bool): load/save the derived equations from/to an on-disk cache (in `~/.cache/gme/`) keyed on the other arguments? (set false when debugging the derivations)
 
         Attributes:
             GME equations (:class:`sympy.Eq <sympy.core.relational.Equality>` etc):
@@ -88,12 +260,35 @@ class Equations:
 
         self.eta = eta
         self.mu = mu
+        # Rational metadata and the {symbol: value} substitution dict are computed
+        #   once here rather than repeatedly in the derivation methods
+        self.eta_dbldenom = 2*denom(eta)
+        self._eta_mu_sub = {gmes.eta: eta, gmes.mu: mu}
+        self.parameters = parameters
         self.do_raw = do_raw
         self.ibc_type = ibc_type
         self.beta_type = beta_type
         self.varphi_type = varphi_type
+        self._e2d_cache = {}
         if do_nothing: return
 
+        # The full derivation pipeline is a pure function of the ctor arguments,
+        #   so cache the derived equations on disk and reload them on a key match
+        #   (skipped for geodesic runs, whose lambdified attributes don't pickle)
+        self._cache_path = None
+        if use_cache and not do_geodesic:
+            key = hashlib.blake2b(repr( (_code_fingerprint,
+                                         eta, mu, beta_type, varphi_type, ibc_type,
+                                         do_raw, do_idtx, parameters) ).encode()).hexdigest()
+            self._cache_path = Path('~/.cache/gme').expanduser()/f'eqns-{key}.pkl'
+            if self._cache_path.exists():
+                try:
+                    with open(self._cache_path,'rb') as file:
+                        self.__dict__.update(pickle.load(file))
+                    return
+                except Exception:
+                    pass   # stale/corrupt cache entry: fall through and re-derive
+
         self.define_p_eqns()
         self.define_r_eqns()
         self.define_xi_eqns()
@@ -107,18 +302,271 @@ class Equations:
         self.define_pdot_eqns()
         self.define_Hamiltons_eqns()
         self.define_tanalpha_eqns()
-        self.define_tanbeta_eqns()
-        self.define_g_eqns()
+        # The tanbeta and g* derivations are independent of one another and both
+        #   CPU-bound, so farm them out to worker processes where possible
+        #   (define_idtx_fgtx_eqns depends on g*, so it cannot join them)
+        self._derive_parallel(('define_tanbeta_eqns', 'define_g_eqns'))
         if do_idtx: self.define_idtx_fgtx_eqns()
         if do_geodesic:
             self.prep_geodesic_eqns(parameters if not do_raw else None)
             self.define_geodesic_eqns(parameters if not do_raw else None)
-        self.define_px_poly_eqn()
+        # The px-polynomial, indicatrix/figuratrix, and initial/boundary-condition
+        #   equation groups are derived lazily, on first attribute access:
+        #   see `_lazy_eqn_groups` and `__getattr__` below
+
+        self._save_cache()
+
+
+    def _save_cache(self):
+        """Dump the pickle-safe derived attributes to the on-disk cache (best effort)."""
+        if self.__dict__.get('_cache_path') is None:
+            return
+        try:
+            self._cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self._cache_path,'wb') as file:
+                pickle.dump({k_:v_ for k_,v_ in self.__dict__.items()
+                             if not k_.startswith('_') and not callable(v_)}, file)
+        except Exception:
+            pass   # cache dir not writable: caching is best-effort only
+
+
+    def _sub(self, eqn):
+        r"""
+        Return the :math:`\{\text{lhs}: \text{rhs}\}` substitution dictionary for `eqn`,
+        memoized in `self._e2d_cache` so that repeated `.subs(...)` calls on the same
+        equation reuse a single dictionary rather than rebuilding it each time.
+
+        Args:
+            eqn (:class:`sympy.Eq <sympy.core.relational.Equality>`): equation to convert
+
+        Returns:
+            dict: the (cached) substitution dictionary
+        """
+        # Keyed on the Eq itself (SymPy exprs hash by structure): id() keys
+        #   are not stable across processes and can collide after gc reuse
+        sub_dict = self._e2d_cache.get(eqn)
+        if sub_dict is None:
+            sub_dict = {eqn.lhs: eqn.rhs}
+            self._e2d_cache[eqn] = sub_dict
+        return sub_dict
+
+
+    # Placeholder for the ubiquitous p_x**2 + p_z**2 subexpression: collapsing it
+    #   to a single symbol shrinks the trees handed to simplify/factor
+    _p_norm_sqrd = sy.Symbol('_P2', real=True, positive=True)
+
+    def _collapse_p_norm(self, expr, op):
+        r"""
+        Apply the simplification operation `op` to `expr` with every occurrence of
+        :math:`p_x^2+p_z^2` collapsed to a single placeholder symbol, then restore
+        the full form.  Because the placeholder must not survive into any expression
+        that is later differentiated with respect to :math:`p_x` or :math:`p_z`,
+        the restoration is unconditional.
+
+        Args:
+            expr (:class:`sympy.Expr <sympy.core.expr.Expr>` or :class:`sympy.Eq <sympy.core.relational.Equality>`): expression to simplify
+            op (callable): simplification operation, e.g. :func:`simplify` or :func:`factor`
+
+        Returns:
+            the result of `op` with :math:`p_x^2+p_z^2` restored
+        """
+        collapsed = expr.subs({px**2+pz**2: self._p_norm_sqrd})
+        return op(collapsed).xreplace({self._p_norm_sqrd: px**2+pz**2})
+
+    def _dH(self, var):
+        r"""
+        Return the raw partial derivative of the Hamiltonian with respect to `var`
+        (of :math:`H(\varphi(r^x))` for :math:`r^x`, of :math:`H(\varphi)` otherwise),
+        memoized so the tree walk done by :func:`diff <sympy.diff>` happens only once
+        per variable.
+
+        Args:
+            var (:class:`sympy.Symbol <sympy.core.symbol.Symbol>`): differentiation variable
+
+        Returns:
+            :class:`sympy.Expr <sympy.core.expr.Expr>`: the (cached) partial derivative
+        """
+        key = ('dH', var)
+        if key not in self._e2d_cache:
+            source_eqn = self.H_varphi_rx_eqn if var is rx else self.H_eqn
+            self._e2d_cache[key] = diff(source_eqn.rhs, var)
+        return self._e2d_cache[key]
+
+    # Map from each lazily derived equation group to the attributes it defines:
+    #   accessing any one of the attributes triggers derivation of its group
+    _lazy_eqn_groups = (
+        ('define_idtx_fgtx_eqns',
+             ('pz_cosbeta_varphi_eqn', 'cosbetasqrd_pz_varphi_solns', 'cosbetasqrd_pz_varphi_soln',
+              'fgtx_cossqrdbeta_pz_varphi_eqn', 'fgtx_tanbeta_pz_varphi_eqn', 'fgtx_px_pz_varphi_eqn',
+              'idtx_rdotx_pz_varphi_eqn', 'idtx_rdotz_pz_varphi_eqn',
+              'fgtx_px_pz_fn', 'idtx_rdotx_fn', 'idtx_rdotz_fn')),
+        ('define_px_poly_eqn',
+             ('poly_px_xiv_varphi_eqn', 'poly_px_xiv0_eqn')),
+        ('_derive_ibc_eqns',
+             ('pzpx_unity_eqn', 'pz0_xiv0_eqn', 'boundary_eqns', 'tanbeta_initial_eqn',
+              'p_initial_eqn', 'px_initial_eqn', 'pz_initial_eqn', 'rz_initial_eqn')),
+    )
+
+    def __getattr__(self, name):
+        for method_, attrs_ in self._lazy_eqn_groups:
+            if name in attrs_:
+                getattr(self, method_)()
+                # Refresh the on-disk cache so later sessions reload this
+                #   group rather than re-deriving it
+                self._save_cache()
+                try:
+                    return self.__dict__[name]
+                except KeyError:
+                    # the derivation bailed out without producing this attribute
+                    raise AttributeError(name) from None
+        raise AttributeError(name)
+
+    def _derive_parallel(self, method_names):
+        r"""
+        Run the named (mutually independent) derivation methods in parallel worker
+        processes, merging the attributes each one defines back into this instance.
+        Falls back to sequential in-process execution if the process pool cannot be
+        used (e.g. the platform disallows it, or a result fails to pickle).
+
+        Args:
+            method_names (tuple of str): the `define_*` methods to run
+        """
+        state = {k_: v_ for k_, v_ in self.__dict__.items()
+                 if not k_.startswith('_') and not callable(v_)}
+        try:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=len(method_names)) \
+                    as executor:
+                jobs = [executor.submit(_run_eqn_method, state, method_name)
+                        for method_name in method_names]
+                results = [job_.result() for job_ in jobs]
+        except Exception:
+            for method_name in method_names:
+                getattr(self, method_name)()
+            return
+        for result in results:
+            self.__dict__.update(result)
+
+    def _derive_ibc_eqns(self):
+        """Derive the initial/boundary-condition equation group in one go."""
         self.prep_ibc_eqns()
         self.define_ibc_eqns()
         self.set_ibc_eqns()
 
 
+    def lambdify_varphi(self, parameters=None):
+        r"""
+        Return a fast numerical version of `varphi_rx_eqn` as a function of :math:`r^x`.
+
+        The expression is numerically evaluated (:meth:`evalf`) before lambdification
+        so that constant subexpressions are folded into floats, and the resulting
+        scalar function is JIT-compiled and vectorized with :mod:`numba` when available
+        (falling back to a plain :mod:`numpy` lambdification otherwise).
+        Compiled functions are cached per parameter set, so the JIT cost is paid once.
+
+        Args:
+            parameters (dict): model parameter values to substitute
+                (defaults to the dictionary passed at instantiation)
+
+        Returns:
+            function: vectorized callable mapping :math:`r^x` value(s) to :math:`\varphi`
+        """
+        if parameters is None:
+            parameters = self.parameters if self.parameters is not None else {}
+        key = ('lambdify_varphi', frozenset(parameters.items()))
+        fn = self._e2d_cache.get(key)
+        if fn is None:
+            varphi_expr = self.varphi_rx_eqn.rhs.xreplace(parameters).evalf()
+            try:
+                # vectorize jits the scalar function itself; wrapping an
+                #   already-njit'd Dispatcher would raise a TypeError
+                from numba import vectorize, float64
+                fn = vectorize([float64(float64)])( lambdify((rx,), varphi_expr, 'math') )
+            except Exception:
+                # numba missing, or the expression won't compile in nopython mode
+                fn = lambdify((rx,), varphi_expr, 'numpy')
+            self._e2d_cache[key] = fn
+        return fn
+
+
+    def lambdify(self, expr, args, backend='numpy'):
+        r"""
+        Lambdify `expr` with common-subexpression elimination always enabled.
+
+        The derived GME expressions repeat large subterms (powers of
+        :math:`p_x^2+p_z^2`, the :math:`\varphi(r^x)` polynomial, etc), for which
+        `cse=True` generates much shorter numerical code. For the `numpy` backend
+        the expression is also :meth:`evalf`'d first so symbolic constants fold to floats.
+
+        Args:
+            expr (:class:`sympy.Expr <sympy.core.expr.Expr>` or :class:`sympy.Matrix <sympy.matrices.dense.MutableDenseMatrix>`): expression to lambdify
+            args (tuple): argument symbols for the generated function
+            backend (str): lambdify modules choice (default `'numpy'`)
+
+        Raises:
+            ValueError: if `expr` contains free symbols not covered by `args`,
+                which would otherwise surface only as symbolic (non-numeric)
+                output when the generated function is called
+
+        Returns:
+            function: the lambdified callable
+        """
+        stray_symbols = expr.free_symbols - set(args)
+        if stray_symbols:
+            raise ValueError(f'Expression contains symbols not in args: {stray_symbols}')
+        expr_ = expr.evalf() if backend=='numpy' else expr
+        try:
+            return sy.lambdify(args, expr_, modules=backend, cse=True)
+        except TypeError:
+            # SymPy < 1.9 has no lambdify(cse=...) : emulate it by lambdifying
+            #   each cse temporary and the reduced expression separately and
+            #   composing them, so the shared subtrees are still emitted once
+            replacements, (reduced_,) = sy.cse(expr_, optimizations='basic')
+            tmp_symbols = [tmp_symbol for tmp_symbol,_ in replacements]
+            tmp_fns = [sy.lambdify(tuple(args)+tuple(tmp_symbols[:i_]), tmp_expr,
+                                   modules=backend)
+                       for i_, (_,tmp_expr) in enumerate(replacements)]
+            reduced_fn = sy.lambdify(tuple(args)+tuple(tmp_symbols), reduced_,
+                                     modules=backend)
+            def composed_fn(*values):
+                for tmp_fn in tmp_fns:
+                    values = values + (tmp_fn(*values),)
+                return reduced_fn(*values)
+            return composed_fn
+
+
+    def _lambdify_metric_mat(self, mat):
+        r"""
+        Lambdify a symbolic 2x2 metric matrix as a single callable of
+        :math:`(r^x, v^x, v^z, \varepsilon)` returning a `(..., 2, 2)` array.
+
+        When :mod:`numba` is available each entry is compiled as a ufunc, so
+        scalar and 1-D array arguments alike dispatch without per-call Python
+        overhead; otherwise a plain matrix lambdification is returned.
+
+        Args:
+            mat (:class:`sympy.Matrix <sympy.matrices.dense.MutableDenseMatrix>`): 2x2 matrix to lambdify
+
+        Returns:
+            function: the compiled callable
+        """
+        try:
+            from numba import vectorize, float64
+            entry_fns = [ vectorize([float64(float64,float64,float64,float64)],
+                                    nopython=True, fastmath=True)(
+                            lambdify((rx, rdotx, rdotz, varepsilon),
+                                     _expand_small_powers(
+                                        _hornerize(sy.together(mat[i_,j_]), rx).evalf()),
+                                     modules='math', cse=True) )
+                          for i_ in [0,1] for j_ in [0,1] ]
+        except Exception:
+            # numba missing, or an entry won't compile in nopython mode
+            return self.lambdify( mat, (rx, rdotx, rdotz, varepsilon) )
+        def metric_mat_fn(rx_, rdotx_, rdotz_, varepsilon_):
+            entries_ = [fn_(rx_, rdotx_, rdotz_, varepsilon_) for fn_ in entry_fns]
+            return np.stack(entries_, axis=-1).reshape(np.shape(entries_[0])+(2,2))
+        return metric_mat_fn
+
+
     def define_p_eqns(self):
         r"""
         Define normal slowness :math:`p` and derive related equations
@@ -150,15 +598,23 @@ class Equations:
         self.pz_p_beta_eqn = Eq( pz, -p*cos(beta) )
         self.p_norm_pxpz_eqn = Eq( trigsimp(sqrt(self.px_p_beta_eqn.rhs**2 + self.pz_p_beta_eqn.rhs**2)),
                                    (sqrt(self.px_p_beta_eqn.lhs**2 + self.pz_p_beta_eqn.lhs**2)) )
-        self.tanbeta_pxpz_eqn = Eq( simplify(-self.px_p_beta_eqn.rhs/self.pz_p_beta_eqn.rhs),
+        # trigsimp suffices (sin/cos -> tan); no need for the full simplify machinery
+        self.tanbeta_pxpz_eqn = Eq( trigsimp(-self.px_p_beta_eqn.rhs/self.pz_p_beta_eqn.rhs),
                                              -self.px_p_beta_eqn.lhs/self.pz_p_beta_eqn.lhs )
-        self.sinbeta_pxpz_eqn = sy.Eq(sin(beta),
-                    solve(self.px_p_beta_eqn,sin(beta))[0].subs(e2d(self.p_norm_pxpz_eqn)))
-        self.cosbeta_pxpz_eqn = sy.Eq(cos(beta),
-                    solve(self.pz_p_beta_eqn,cos(beta))[0].subs(e2d(self.p_norm_pxpz_eqn)))
-        self.pz_px_tanbeta_eqn = Eq(pz, solve(self.tanbeta_pxpz_eqn,pz)[0])
-        self.px_pz_tanbeta_eqn = Eq(px, solve(self.tanbeta_pxpz_eqn,px)[0])
-        self.p_pz_cosbeta_eqn = Eq(p, solve(self.pz_p_beta_eqn,p)[0])
+        # These are trivial rearrangements, so spell out the closed forms
+        #   (checked against the docstrings above) rather than invoking solve
+        self.sinbeta_pxpz_eqn = sy.Eq(sin(beta), px/sqrt(px**2+pz**2))
+        self.cosbeta_pxpz_eqn = sy.Eq(cos(beta), -pz/sqrt(px**2+pz**2))
+        self.pz_px_tanbeta_eqn = Eq(pz, -px/tan(beta))
+        self.px_pz_tanbeta_eqn = Eq(px, -pz*tan(beta))
+        self.p_pz_cosbeta_eqn = Eq(p, -pz/cos(beta))
+        # Unified map resolving the beta-trig functions and the slowness norm to
+        #   their (px,pz) forms: later derivations apply it in one xreplace pass
+        #   where a chain of single-target substitutions used to run
+        self._beta_pxpz_sub = {**self._sub(self.tanbeta_pxpz_eqn),
+                               **self._sub(self.sinbeta_pxpz_eqn),
+                               **self._sub(self.cosbeta_pxpz_eqn),
+                               **self._sub(self.p_norm_pxpz_eqn)}
 
 
     def define_r_eqns(self):
@@ -191,8 +647,8 @@ class Equations:
         """
         self.xi_p_eqn = Eq( xi, 1/p )
         self.xiv_pz_eqn = (Eq( xiv, -1/pz ))
-        self.p_xi_eqn = Eq(p, solve(self.xi_p_eqn,p)[0])
-        self.pz_xiv_eqn = Eq(pz, solve(self.xiv_pz_eqn,pz)[0])
+        self.p_xi_eqn = Eq(p, 1/xi)
+        self.pz_xiv_eqn = Eq(pz, -1/xiv)
 
 
     def define_xi_model_eqn(self):
@@ -217,7 +673,7 @@ class Equations:
         if self.do_raw:
             self.xi_varphi_beta_eqn = Eq(xi, xi_model)
         else:
-            self.xi_varphi_beta_eqn = Eq(xi, xi_model.subs({eta: self.eta}))
+            self.xi_varphi_beta_eqn = Eq(xi, xi_model.xreplace(self._eta_mu_sub))
 
 
     def define_xi_related_eqns(self):
@@ -242,21 +698,65 @@ class Equations:
             eta_dbldenom   (:class:`sympy.Int <sympy.core.numbers.Integer>`) :
                 a convenience variable, recording double the denominator of :math:`\eta`, which must itself be a rational number
         """
-        eta_dbldenom = 2*denom(self.eta)
-        self.xiv_varphi_pxpz_eqn = simplify( Eq( xiv, (self.xi_varphi_beta_eqn.rhs/cos(beta))
-                                                .subs(e2d(self.tanbeta_pxpz_eqn))
-                                                .subs(e2d(self.cosbeta_pxpz_eqn))
-                                                .subs(e2d(self.sinbeta_pxpz_eqn))
-                                                .subs({Abs(px):px}) ) )
+        eta_dbldenom = self.eta_dbldenom
+        self.xiv_varphi_pxpz_eqn = self._collapse_p_norm(
+                                        Eq( xiv, (self.xi_varphi_beta_eqn.rhs/cos(beta))
+                                                .xreplace(self._beta_pxpz_sub) ), simplify )
         xiv_eqn = self.xiv_varphi_pxpz_eqn
-        px_xiv_varphi_eqn = simplify(
-            Eq( ((xiv_eqn.subs({Abs(px):px})).rhs)**eta_dbldenom - xiv_eqn.lhs**eta_dbldenom , 0)
-                            .subs(e2d(self.pz_xiv_eqn))
-                   )
+        # This difference is a rational function of px, xiv and varphi, so cancel
+        #   (which works in the Poly domain) normalizes it far faster than simplify
+        px_xiv_varphi = ( (xiv_eqn.rhs)**eta_dbldenom - xiv_eqn.lhs**eta_dbldenom ) \
+                            .xreplace(self._sub(self.pz_xiv_eqn))
         # HACK!!  Get rid of xiv**2 multiplier... should be a cleaner way of doing this
-        self.px_xiv_varphi_eqn = factor(Eq(px_xiv_varphi_eqn.lhs/xiv**2,0))
-        self.eta_dbldenom = eta_dbldenom
+        self.px_xiv_varphi_eqn = Eq( factor(sy.cancel(px_xiv_varphi/xiv**2)), 0 )
+
+
+    @cached_property
+    def varphi_model_ramp_eqn(self):
+        r"""
+        Pure "channel" flow model :math:`\varphi(\mathbf{r})` (lazily computed)
+        """
+        # The implicit assumption here is that upstream area A ~ x^2, which will not be true
+        #   for a "hillslope" component, and for which we should have a transition to A ~ x
+        return Eq(varphi_r, varphi_0*((x/x_1)**(mu*2) + varepsilon)).xreplace({x:x_1-rx})
 
+    @cached_property
+    def varphi_model_rampmu_chi0_eqn(self):
+        r"""
+        Pure "channel" flow model :math:`\varphi(\mathbf{r})` (lazily computed)
+        """
+        return Eq(varphi_r, varphi_0*((x/x_1)**(mu*2) + varepsilon)).xreplace({x:x_1-rx})
+
+    @cached_property
+    def varphi_model_rampflat_eqn(self):
+        r"""
+        "Hillslope-channel" flow model :math:`\varphi(\mathbf{r})` for :math:`\mu=1/2`
+        (lazily computed, since the `integrate` and `simplify` here are expensive)
+        """
+        # Closed-form antiderivative of the sigmoid 1/(1+exp(-x/x_sigma)),
+        #   hard-coded to bypass the integrate machinery
+        softplus_fn = x_sigma*log(1+exp(x/x_sigma))
+        return Eq(varphi_r, simplify(
+            varphi_0*(  (chi/(x_1))*softplus_fn + 1 )
+                                .xreplace({x:-rx+x_1}) ))
+
+    @cached_property
+    def varphi_model_rampflatmu_eqn(self):
+        r"""
+        "Hillslope-channel" flow model :math:`\varphi(\mathbf{r})` for general :math:`\mu`
+        (lazily computed, since the `integrate` and `simplify` here are expensive)
+        """
+        # Closed-form antiderivative of the smooth step 1/(1+exp(((x_1-x_h)-x)/x_sigma)),
+        #   hard-coded to bypass the integrate machinery. The (x_1-x_h) offset
+        #   makes it identical to integrate's result
+        #   x + x_sigma*log(1+exp(((x_1-x_h)-x)/x_sigma)); the -chi*(1-x_h/x_1)
+        #   term below exists to cancel exactly this constant on the flat
+        softplus_fn = x_sigma*log(1+exp((x-(x_1-x_h))/x_sigma)) + (x_1-x_h)
+        # TODO: fix deprecated chi usage
+        smooth_break_fn = simplify( ((chi/(x_1))*softplus_fn-chi*(1-x_h/x_1)+1)**(mu*2) )
+        return Eq(varphi_r, simplify(
+                    varphi_0*smooth_break_fn.xreplace({x:x_1-x})
+                                .xreplace({x:rx}) ))
 
     def define_varphi_model_eqn(self):
         r"""
@@ -276,20 +776,6 @@ class Equations:
                 - "hillslope-channel" model `varphi_model_rampflat_eqn` if `self.varphi_type=='ramp-flat'`
 
         """
-        # The implicit assumption here is that upstream area A ~ x^2, which will not be true
-        #   for a "hillslope" component, and for which we should have a transition to A ~ x
-        self.varphi_model_ramp_eqn = Eq(varphi_r, varphi_0*((x/x_1)**(mu*2) + varepsilon)).subs({x:x_1-rx})
-        self.varphi_model_rampmu_chi0_eqn = Eq(varphi_r, varphi_0*((x/x_1)**(mu*2) + varepsilon)).subs({x:x_1-rx})
-        self.varphi_model_rampflat_eqn = Eq(varphi_r, simplify(
-            varphi_0*(  (chi/(x_1))*integrate(1/(1+sy.exp(-x/x_sigma)),x) + 1 )
-                                .subs({x:-rx+x_1}) ))
-        smooth_step_fn = 1/(1+exp(((x_1-x_h)-x)/x_sigma))
-        # smooth_break_fn = (1+(chi/(x_1))**mu*integrate(smooth_step_fn,x))
-        # TODO: fix deprecated chi usage
-        smooth_break_fn = simplify( ((chi/(x_1))*(sy.integrate(smooth_step_fn,x))-chi*(1-x_h/x_1)+1)**(mu*2) )
-        self.varphi_model_rampflatmu_eqn = Eq(varphi_r, simplify(
-                    varphi_0*smooth_break_fn.subs({x:x_1-x})
-                                .subs({x:rx}) ))
         if self.varphi_type=='ramp':
             varphi_model_eqn = self.varphi_model_ramp_eqn
         elif self.varphi_type=='ramp-flat':
@@ -336,34 +822,30 @@ class Equations:
             pz_varphi_rx_beta_eqn   (:class:`sympy.Eq <sympy.core.relational.Equality>`) :
                 :math:`p_{z} = - \dfrac{\cos{\left(\beta \right)} \left|{\sin{\left(\beta \right)}}\right|^{- \eta}}{\varphi_0 \left(\varepsilon + \left(\dfrac{x_{1} - {r}^x}{x_{1}}\right)^{2 \mu}\right)}`
         """
-        self.p_varphi_beta_eqn  = self.p_xi_eqn.subs(e2d(self.xi_varphi_beta_eqn))
-        # Note force px >= 0
-        self.p_varphi_pxpz_eqn  = ( self.p_varphi_beta_eqn
-                                          .subs(e2d(self.tanbeta_pxpz_eqn))
-                                          .subs(e2d(self.sinbeta_pxpz_eqn))
-                                          .subs(e2d(self.p_norm_pxpz_eqn))
-                                          .subs({Abs(px):px})
-                                        )
+        self.p_varphi_beta_eqn  = self.p_xi_eqn.xreplace(self._sub(self.xi_varphi_beta_eqn))
+        self.p_varphi_pxpz_eqn  = self.p_varphi_beta_eqn.xreplace(self._beta_pxpz_sub)
         # Don't do this simplification step because it messes up later calc of rdotz_on_rdotx_eqn etc
         # if self.eta==1 and self.beta_type=='sin':
         #     self.p_varphi_pxpz_eqn = simplify(Eq(self.p_varphi_pxpz_eqn.lhs/sqrt(px**2+pz**2),
         #                                     self.p_varphi_pxpz_eqn.rhs/sqrt(px**2+pz**2)))
 
-        self.p_rx_pxpz_eqn = simplify( self.p_varphi_pxpz_eqn.subs({varphi_r:self.varphi_rx_eqn.rhs}) )
-        self.p_rx_tanbeta_eqn = self.p_rx_pxpz_eqn.subs({pz:self.pz_px_tanbeta_eqn.rhs})
+        self.p_rx_pxpz_eqn = self._collapse_p_norm(
+                        self.p_varphi_pxpz_eqn.xreplace({varphi_r:self.varphi_rx_eqn.rhs}), simplify )
+        self.p_rx_tanbeta_eqn = self.p_rx_pxpz_eqn.xreplace({pz:self.pz_px_tanbeta_eqn.rhs})
         self.px_beta_eqn = Eq(px, self.p_rx_tanbeta_eqn.rhs * sin(beta) )
         self.pz_beta_eqn = Eq(pz, -self.p_rx_tanbeta_eqn.rhs * cos(beta) )
+        # Compose cos(beta) -> 1/sqrt(1+tan(beta)**2) -> pxpz form up front
+        #   so a single xreplace pass suffices
         self.xiv_pxpz_eqn = simplify(Eq(xiv,-cos(beta)/p)
-               .subs({cos(beta):1/sqrt(1+tan(beta)**2)})
-               .subs({self.tanbeta_pxpz_eqn.lhs:self.tanbeta_pxpz_eqn.rhs})
-               .subs({self.p_norm_pxpz_eqn.lhs:self.p_norm_pxpz_eqn.rhs}))
+               .xreplace({cos(beta):1/sqrt(1+self.tanbeta_pxpz_eqn.rhs**2),
+                          self.p_norm_pxpz_eqn.lhs:self.p_norm_pxpz_eqn.rhs}))
 
-        tmp = self.xi_varphi_beta_eqn.subs(e2d(self.xi_p_eqn)).subs(e2d(self.p_pz_cosbeta_eqn))
+        tmp = self.xi_varphi_beta_eqn.xreplace(self._sub(self.xi_p_eqn)).xreplace(self._sub(self.p_pz_cosbeta_eqn))
         self.pz_varphi_beta_eqn = Eq(pz, solve(tmp,pz)[0])
-        tmp = self.pz_varphi_beta_eqn.subs(e2d(self.pz_px_tanbeta_eqn))
+        tmp = self.pz_varphi_beta_eqn.xreplace(self._sub(self.pz_px_tanbeta_eqn))
         self.px_varphi_beta_eqn = Eq(px, solve(tmp,px)[0])
-        self.pz_varphi_rx_beta_eqn = self.pz_varphi_beta_eqn.subs(e2d(self.varphi_rx_eqn))
-        self.px_varphi_rx_beta_eqn = self.px_varphi_beta_eqn.subs(e2d(self.varphi_rx_eqn))
+        self.pz_varphi_rx_beta_eqn = self.pz_varphi_beta_eqn.xreplace(self._sub(self.varphi_rx_eqn))
+        self.px_varphi_rx_beta_eqn = self.px_varphi_beta_eqn.xreplace(self._sub(self.varphi_rx_eqn))
 
 
     def define_Fstar_eqns(self):
@@ -376,11 +858,10 @@ class Equations:
             Fstar_eqn   (:class:`sympy.Eq <sympy.core.relational.Equality>`) :
                 :math:`F^{*} = p_{x}^{\eta} \left(p_{x}^{2} + p_{z}^{2}\right)^{\frac{1}{2} - \frac{\eta}{2}} \varphi{\left(\mathbf{r} \right)}`
         """
-        # Note force px >= 0
-        self.Okubo_Fstar_eqn = simplify( Eq(self.p_norm_pxpz_eqn.rhs/Fstar, self.p_varphi_pxpz_eqn.rhs, ) \
-                                            .subs({Abs(px):px,sy.sign(px):1}) )
-        self.Fstar_eqn = Eq(Fstar, (solve(self.Okubo_Fstar_eqn,Fstar)[0]).subs({varphi_rx:varphi})) \
-                                            .subs({Abs(px):px,sy.sign(px):1})
+        self.Okubo_Fstar_eqn = self._collapse_p_norm(
+                        Eq(self.p_norm_pxpz_eqn.rhs/Fstar, self.p_varphi_pxpz_eqn.rhs, ), simplify )
+        self.Fstar_eqn = Eq(Fstar, (solve(self.Okubo_Fstar_eqn,Fstar)[0])
+                                            .xreplace({varphi_rx:varphi}))
 
 
     def define_H_eqns(self):
@@ -394,10 +875,13 @@ class Equations:
             H_varphi_rx_eqn   (:class:`sympy.Eq <sympy.core.relational.Equality>`) :
                 :math:`H = \dfrac{\varphi_0^{2} p_{x}^{2 \eta} x_{1}^{- 4 \mu} \left(p_{x}^{2} + p_{z}^{2}\right)^{1 - \eta} \left(\varepsilon x_{1}^{2 \mu} + \left(x_{1} - {r}^x\right)^{2 \mu}\right)^{2}}{2}`
         """
-        self.H_eqn =  ( Eq( H, simplify(self.Fstar_eqn.rhs**2/2) )
+        # powsimp is the only transformation actually needed here: it merges the
+        #   squared power products without invoking the full simplify pipeline
+        self.H_eqn =  ( Eq( H, sy.powsimp(self.Fstar_eqn.rhs**2/2, combine='exp') )
                                 # .subs({Abs(px):px,sy.sign(px):1})
                             )
-        self.H_varphi_rx_eqn = simplify(self.H_eqn.subs(varphi_r,self.varphi_rx_eqn.rhs))
+        self.H_varphi_rx_eqn = Eq( H, sy.powsimp(self.H_eqn.rhs.xreplace({varphi_r:self.varphi_rx_eqn.rhs}),
+                                                 combine='exp') )
 
 
     def define_rdot_eqns(self):
@@ -426,16 +910,20 @@ class Equations:
         """
         self.rdotx_rdot_alpha_eqn = Eq( rdotx, rdot*cos(alpha) )
         self.rdotz_rdot_alpha_eqn = Eq( rdotz, rdot*sin(alpha) )
-        self.rdotx_pxpz_eqn = simplify( Eq(rdotx, sy.diff(self.H_eqn.rhs,px)) )
+        # The raw diff output only needs its power products recombined,
+        #   so use powsimp rather than the (much slower) generic simplify
+        self.rdotx_pxpz_eqn = Eq( rdotx, sy.powsimp(self._dH(px), combine='exp') )
                                 # simplify(sy.diff(self.H_eqn.rhs,px)).subs({Abs(px):px,sy.sign(px):1}) ) )
-        self.rdotz_pxpz_eqn = simplify( Eq( rdotz, sy.diff(self.H_eqn.rhs,pz)) )
+        self.rdotz_pxpz_eqn = Eq( rdotz, sy.powsimp(self._dH(pz), combine='exp') )
         # self.rdotz_pxpz_eqn = simplify( simplify( Eq( rdotz, simplify(sy.diff(self.H_eqn.rhs,pz))\
         #                                 .subs({Abs(px):px,sy.sign(px):1}) ) )
         #                                     .subs({px:pxp}) ) \
         #                                         .subs({pxp:px})
+        # cancel does Poly-based GCD cancellation on the quotient, which is all
+        #   that is needed here; generic simplify is much slower
         self.rdotz_on_rdotx_eqn = factor( Eq( rdotz/rdotx,
-                                        simplify( (self.rdotz_pxpz_eqn.rhs/self.rdotx_pxpz_eqn.rhs) ) ).subs({Abs(px):px}) )
-        self.rdotz_on_rdotx_tanbeta_eqn = factor( self.rdotz_on_rdotx_eqn.subs({px:self.px_pz_tanbeta_eqn.rhs}) )
+                                        sy.cancel( (self.rdotz_pxpz_eqn.rhs/self.rdotx_pxpz_eqn.rhs) ) ) )
+        self.rdotz_on_rdotx_tanbeta_eqn = factor( self.rdotz_on_rdotx_eqn.xreplace({px:self.px_pz_tanbeta_eqn.rhs}) )
         self.rdot_vec_eqn = Eq(rdotvec,Matrix([self.rdotx_pxpz_eqn.rhs, self.rdotz_pxpz_eqn.rhs]))
         self.rdot_p_unity_eqn = Eq( rdotx*px+rdotz*pz, 1)
 
@@ -456,10 +944,10 @@ class Equations:
                 \left(p_{x}^{2} + p_{z}^{2}\right)^{1 - \eta} \left(x_{1} - {r}^x\right)^{2 \mu - 1}
                 \left(\varepsilon x_{1}^{2 \mu} + \left(x_{1} - {r}^x\right)^{2 \mu}\right) & 0\end{matrix}\right]`
         """
-        self.pdotx_pxpz_eqn = simplify(Eq(pdotx, (-diff(self.H_varphi_rx_eqn.rhs,rx)) ))\
-                                .subs({Abs(pz):-pz,Abs(px):px,Abs(px*pz):-px*pz,Abs(px/pz):-px/pz})
-        self.pdotz_pxpz_eqn = simplify(Eq(pdotz,
-                (0*diff(self.varphi_rx_eqn.rhs,rx)*(-self.tanbeta_pxpz_eqn.rhs)*self.H_eqn.rhs/varphi_r) ))
+        # diff already returns a factored polynomial times a derivative,
+        #   so a targeted factor suffices where a full simplify used to run
+        self.pdotx_pxpz_eqn = Eq(pdotx, (-self._dH(rx)).factor() )
+        self.pdotz_pxpz_eqn = Eq(pdotz, S.Zero)
         self.pdot_covec_eqn = Eq(pdotcovec, Matrix([[self.pdotx_pxpz_eqn.rhs], [self.pdotz_pxpz_eqn.rhs]]).T)
 
 
@@ -480,12 +968,14 @@ class Equations:
                 \dot{p}_z = 0
                 \end{matrix}\right]`
         """
-        self.hamiltons_eqns = Matrix(
-             (factor(simplify(self.rdotx_pxpz_eqn.subs(e2d(self.varphi_rx_eqn))).subs({rdotx:rdotx_true, rdotz:rdotz_true})).subs({Abs(px):px}),
-              factor(simplify(self.rdotz_pxpz_eqn.subs(e2d(self.varphi_rx_eqn))).subs({rdotx:rdotx_true, rdotz:rdotz_true})).subs({Abs(px):px}),
-              factor(simplify(self.pdotx_pxpz_eqn.subs(e2d(self.varphi_rx_eqn))).subs({rdotx:rdotx_true, rdotz:rdotz_true})).subs({Abs(px):px}),
-              factor(simplify(self.pdotz_pxpz_eqn.subs(e2d(self.varphi_rx_eqn))).subs({rdotx:rdotx_true, rdotz:rdotz_true})).subs({Abs(px):px})
-             ))
+        # Substitute the flow model into the four Hamilton RHS as a single
+        #   Matrix: one xreplace pass instead of four per-equation subs calls
+        varphi_sub = self._sub(self.varphi_rx_eqn)
+        rhs_matrix = (Matrix([self.rdotx_pxpz_eqn.rhs, self.rdotz_pxpz_eqn.rhs,
+                              self.pdotx_pxpz_eqn.rhs, self.pdotz_pxpz_eqn.rhs])
+                      .xreplace(varphi_sub).applyfunc(factor))
+        lhs_list = (rdotx_true, rdotz_true, pdotx, pdotz)
+        self.hamiltons_eqns = Matrix([Eq(lhs_, rhs_) for lhs_, rhs_ in zip(lhs_list, rhs_matrix)])
 
 
     def define_tanalpha_eqns(self):
@@ -532,29 +1022,59 @@ class Equations:
         self.beta_at_alpha_extremum_numerical_eqn = None
         self.tanbeta_alpha_eqn = None
 
+        # Root selection only needs a numeric answer, so lambdify each candidate
+        #   once and probe it in floating point rather than running symbolic
+        #   substitution plus im() on every test
+        probe_fn_cache = {}
+        def _probe(expr_, args_, values_):
+            probe_fn = probe_fn_cache.get(id(expr_))
+            if probe_fn is None:
+                probe_fn = lambdify(args_, expr_, modules='mpmath')
+                probe_fn_cache[id(expr_)] = probe_fn
+            try:
+                return complex(probe_fn(*values_))
+            except Exception:
+                return complex(np.nan)   # e.g. divide-by-zero at the probe point
+
+        # Substituting a numeric eta up front collapses the expressions fed to
+        #   solve/simplify below; the symbolic path is preserved otherwise
+        if sy.sympify(self.eta).is_number:
+            tanalpha_beta_rhs = self.tanalpha_beta_eqn.rhs.xreplace(eta_sub)
+        else:
+            tanalpha_beta_rhs = self.tanalpha_beta_eqn.rhs
+
         if do_find_extrema:
-            alpha_extrema = [simplify(soln) for soln in solve( Eq(diff(self.tanalpha_beta_eqn.rhs, beta),0), beta )]
-            alpha_extrema_real_positive = [extremum for extremum in alpha_extrema
-                                                if sy.im(extremum.subs(eta_sub))==0 and extremum.subs(eta_sub)>0]
+            alpha_extrema = [_cached_simplify(soln) for soln in _cached_solve( Eq(diff(tanalpha_beta_rhs, beta),0), beta )]
+            alpha_extrema_probes = [(extremum, _probe(extremum, (eta,), (float(self.eta),)))
+                                    for extremum in alpha_extrema]
+            alpha_extrema_real_positive = [extremum for extremum, probe_ in alpha_extrema_probes
+                                                if abs(probe_.imag)<1e-12 and probe_.real>0]
             if alpha_extrema_real_positive != []:
                 self.beta_at_alpha_extremum_eqn = Eq(beta_at_alpha_extremum, alpha_extrema_real_positive[0])
-                self.beta_at_alpha_extremum_numerical_eqn = Eq(beta_at_alpha_extremum, (float(sy.N(self.beta_at_alpha_extremum_eqn.rhs.subs(eta_sub)))))
+                self.beta_at_alpha_extremum_numerical_eqn = Eq(beta_at_alpha_extremum, (float(sy.N(self.beta_at_alpha_extremum_eqn.rhs.xreplace(eta_sub)))))
             elif alpha_extrema != []:
                 self.beta_at_alpha_extremum_eqn = Eq(beta_at_alpha_extremum,alpha_extrema[0])
-                self.beta_at_alpha_extremum_numerical_eqn = Eq(beta_at_alpha_extremum, sy.N(alpha_extrema[0].subs(eta_sub)))
+                self.beta_at_alpha_extremum_numerical_eqn = Eq(beta_at_alpha_extremum, sy.N(alpha_extrema[0].xreplace(eta_sub)))
                 print('Warning: real positive root for beta not found')
             else:
                 self.beta_at_alpha_extremum_eqn = Eq(beta_at_alpha_extremum,0)
-                self.beta_at_alpha_extremum_numerical_eqn = Eq(beta_at_alpha_extremum.subs(eta_sub), 0)
+                self.beta_at_alpha_extremum_numerical_eqn = Eq(beta_at_alpha_extremum.xreplace(eta_sub), 0)
 
         if self.eta==1 and self.beta_type=='sin':
             print(r'Cannot compute all $\beta$ equations for $\sin\beta$ model and $\eta=1$')
             return
-        solns = sy.solve(self.tanalpha_beta_eqn.subs({tan(alpha):ta}),tan(beta))
+        solns = _cached_solve(Eq(ta, tanalpha_beta_rhs),tan(beta))
         # # We get multiple roots for tan(beta), so guess which is real by evaluating it at an fairly arbitrary tan(alpha)
-        self.tanbeta_alpha_eqn = Eq(tan(beta), simplify([soln for soln in solns
-            if sy.im(soln.subs(ta,0).subs(eta_sub))==0 or sy.im(soln.subs(ta,0.01).subs(eta_sub))==0 or sy.im(soln.subs(ta,1).subs(eta_sub))==0
-                                    ][0])).subs({ta:tan(alpha)})
+        soln_pick = [soln for soln in solns
+            if any( abs(_probe(soln, (ta,eta), (ta_,float(self.eta))).imag)<1e-12
+                    for ta_ in (0.0, 0.01, 1.0) )
+                    ][0]
+        # Targeted radical/quotient cleanup is all this root needs: only fall back
+        #   to the full simplify machinery if the result is still unwieldy
+        soln_pick = sy.together(sy.radsimp(soln_pick))
+        if sy.count_ops(soln_pick) > 50:
+            soln_pick = _cached_simplify(soln_pick)
+        self.tanbeta_alpha_eqn = Eq(tan(beta), soln_pick).xreplace({ta:tan(alpha)})
 
 
     def define_g_eqns(self):
@@ -611,24 +1131,69 @@ class Equations:
         self.gstar_eigenvectors = None
 
         eta_sub = {eta: self.eta}
-        self.gstar_varphi_pxpz_eqn = Eq(gstar,
-            factor( Matrix([diff(self.rdot_vec_eqn.rhs, self.p_covec_eqn.rhs[0]).T,
-                              diff(self.rdot_vec_eqn.rhs, self.p_covec_eqn.rhs[1]).T]) )).subs(eta_sub)
-        self.det_gstar_varphi_pxpz_eqn = Eq(det_gstar,(simplify(self.gstar_varphi_pxpz_eqn.rhs.subs(eta_sub).det())))
+        # Substituting a numeric eta before differentiation shrinks everything
+        #   this method subsequently inverts, determines and eigen-decomposes
+        eta_is_numeric = sy.sympify(self.eta).is_number
+        rdot_vec_rhs = self.rdot_vec_eqn.rhs.xreplace(eta_sub) if eta_is_numeric \
+                            else self.rdot_vec_eqn.rhs
+        if se is not None:
+            # Differentiate in SymEngine's C++ core (then convert back to SymPy):
+            #   far faster than SymPy diff on these large rational expressions
+            rdot_se = [se.sympify(expr_) for expr_ in rdot_vec_rhs]
+            gstar_mat = Matrix([[sy.sympify(rdot_.diff(se.sympify(p_))) for rdot_ in rdot_se]
+                                    for p_ in (self.p_covec_eqn.rhs[0], self.p_covec_eqn.rhs[1])])
+        else:
+            # Build the 2x2 entry-by-entry: differentiating the column vector and
+            #   transposing would allocate two intermediate matrices per row
+            rdot0_, rdot1_ = rdot_vec_rhs[0], rdot_vec_rhs[1]
+            gstar_mat = Matrix([[diff(rdot0_, p_), diff(rdot1_, p_)]
+                                for p_ in (self.p_covec_eqn.rhs[0], self.p_covec_eqn.rhs[1])])
+        self.gstar_varphi_pxpz_eqn = Eq(gstar, _cached_factor( gstar_mat ))
+        if not eta_is_numeric:
+            self.gstar_varphi_pxpz_eqn = self.gstar_varphi_pxpz_eqn.subs(eta_sub)
+        # eta is already substituted above, so bind the matrix once and share it
+        #   across the det/inverse/eigenvector computations
+        gstar_eta_mat = self.gstar_varphi_pxpz_eqn.rhs
+        # Closed-form 2x2 determinant and inverse, sharing the determinant
+        #   between the two, rather than the generic LU/adjugate machinery
+        a_, b_ = gstar_eta_mat[0,0], gstar_eta_mat[0,1]
+        c_, d_ = gstar_eta_mat[1,0], gstar_eta_mat[1,1]
+        det_gstar_ = a_*d_ - b_*c_
+        self.det_gstar_varphi_pxpz_eqn = Eq(det_gstar,(_cached_simplify(det_gstar_)))
         if self.eta==1 and self.beta_type=='sin':
             print(r'Cannot compute all metric tensor $g^{ij}$ equations for $\sin\beta$ model and $\eta=1$')
             return
-        self.g_varphi_pxpz_eqn = Eq(g, simplify( self.gstar_varphi_pxpz_eqn.rhs.subs(eta_sub).inverse() ))
-        self.gstar_eigen_varphi_pxpz = self.gstar_varphi_pxpz_eqn.rhs.eigenvects()
-        self.gstar_eigenvalues = simplify(
-            Matrix([self.gstar_eigen_varphi_pxpz[0][0],
-                    self.gstar_eigen_varphi_pxpz[1][0]])
-                    .subs({varphi_r:self.varphi_rx_eqn.rhs}) )
-        self.gstar_eigenvectors = (
-            [simplify(Matrix(self.gstar_eigen_varphi_pxpz[0][2][0])
-                            .subs({varphi_r:self.varphi_rx_eqn.rhs})),
-             simplify(Matrix(self.gstar_eigen_varphi_pxpz[1][2][0])
-                            .subs({varphi_r:self.varphi_rx_eqn.rhs}))] )
+        self.g_varphi_pxpz_eqn = Eq(g, _cached_simplify(
+                                        Matrix([[d_, -b_], [-c_, a_]])/det_gstar_ ))
+        # Closed-form 2x2 eigendecomposition (matching the eigenvects() layout):
+        #   avoids the general eigensolver and its characteristic-determinant
+        #   expansion
+        disc_ = sqrt((a_-d_)**2 + 4*b_*c_)
+        lam1_, lam2_ = (a_+d_-disc_)/2, (a_+d_+disc_)/2
+        self.gstar_eigen_varphi_pxpz = [ (lam1_, 1, [Matrix([b_/(lam1_-a_), 1])]),
+                                         (lam2_, 1, [Matrix([b_/(lam2_-a_), 1])]) ]
+        # The eigen-expressions repeat the same 12th-degree radical many times over,
+        #   so share it (and its siblings) through one cse pass, do the varphi
+        #   substitution and simplification on the reduced forms, and only then
+        #   unfold the temporaries back into full expressions
+        varphi_sub = {varphi_r: self.varphi_rx_eqn.rhs}
+        replacements, reduced_list = sy.cse(
+            [Matrix([self.gstar_eigen_varphi_pxpz[0][0],
+                     self.gstar_eigen_varphi_pxpz[1][0]]),
+             Matrix(self.gstar_eigen_varphi_pxpz[0][2][0]),
+             Matrix(self.gstar_eigen_varphi_pxpz[1][2][0])], optimizations='basic')
+        replacements = [(tmp_symbol, _cached_simplify(tmp_expr.xreplace(varphi_sub)))
+                        for tmp_symbol, tmp_expr in replacements]
+        reduced_list = [_cached_simplify(reduced_.xreplace(varphi_sub))
+                        for reduced_ in reduced_list]
+        self._gstar_cse_replacements = replacements
+        tmp_map = {}
+        for tmp_symbol, tmp_expr in replacements:
+            tmp_map[tmp_symbol] = tmp_expr.xreplace(tmp_map)
+        eigenvalues_, eigenvector0_, eigenvector1_ \
+            = [reduced_.xreplace(tmp_map) for reduced_ in reduced_list]
+        self.gstar_eigenvalues = eigenvalues_
+        self.gstar_eigenvectors = [eigenvector0_, eigenvector1_]
 
 
     def define_idtx_fgtx_eqns(self):
@@ -700,50 +1265,123 @@ class Equations:
         #     self.fgtx_tanbeta_pz_varphi_eqn = tanbeta_pz_varphi_eqn
         #     self.fgtx_cossqrdbeta_pz_varphi_eqn = Eq(cos(beta)**2, 1/(1+tanbeta_pz_varphi_eqn.rhs**2))
         # else:
-        eta_sub = {eta: self.eta}
-        pz_cosbeta_varphi_tmp_eqn = ( self.pz_p_beta_eqn
-         .subs({p:self.p_varphi_beta_eqn.rhs})
-         .subs({varphi_r:varphi})
-         .subs(eta_sub)
-         .subs({Abs(tan(beta)):Abs(sin(beta))/Abs(cos(beta))})
-         .subs({Abs(cos(beta)):cos(beta), Abs(sin(beta)):sin(beta)})
-         .subs({sin(beta):sqrt(1-cos(beta)**2)})
-        )
-        pz_cosbeta_varphi_eqn = Eq( pz_cosbeta_varphi_tmp_eqn.lhs**self.eta_dbldenom,
-                                    pz_cosbeta_varphi_tmp_eqn.rhs**self.eta_dbldenom )
-        self.pz_cosbeta_varphi_eqn = pz_cosbeta_varphi_eqn
-
-        self.cosbetasqrd_pz_varphi_solns = None
+        self.pz_cosbeta_varphi_eqn, self.cosbetasqrd_pz_varphi_solns = self._solve_cosbetasqrd()
         self.cosbetasqrd_pz_varphi_soln = None
         self.fgtx_cossqrdbeta_pz_varphi_eqn = None
         self.fgtx_tanbeta_pz_varphi_eqn = None
         self.fgtx_px_pz_varphi_eqn = None
         self.idtx_rdotx_pz_varphi_eqn = None
         self.idtx_rdotz_pz_varphi_eqn = None
-        self.cosbetasqrd_pz_varphi_solns = solve( self.pz_cosbeta_varphi_eqn, cos(beta)**2 )
+        self.fgtx_px_pz_fn = None
+        self.idtx_rdotx_fn = None
+        self.idtx_rdotz_fn = None
         if (self.eta==Rational(1,4) or self.eta==Rational(3,2)) and self.beta_type=='tan':
             print(r'Cannot compute all indicatrix equations for $\tan\beta$ model and $\eta=$'
                         +f'{self.eta}')
             return
+        self.cosbetasqrd_pz_varphi_soln = self._pick_cosbetasqrd_root()
+        ( self.fgtx_cossqrdbeta_pz_varphi_eqn,
+          self.fgtx_tanbeta_pz_varphi_eqn,
+          self.fgtx_px_pz_varphi_eqn ) = self._build_fgtx_eqns()
+        self.idtx_rdotx_pz_varphi_eqn, self.idtx_rdotz_pz_varphi_eqn = self._build_idtx_eqns()
+        # Compiled numeric versions, since these curves are almost always evaluated
+        #   over arrays of pz values rather than manipulated further symbolically
+        self.fgtx_px_pz_fn = self.lambdify(self.fgtx_px_pz_varphi_eqn.rhs, (pz, varphi))
+        self.idtx_rdotx_fn = self.lambdify(self.idtx_rdotx_pz_varphi_eqn.rhs, (pz, varphi))
+        self.idtx_rdotz_fn = self.lambdify(self.idtx_rdotz_pz_varphi_eqn.rhs, (pz, varphi))
+
+
+    def _solve_cosbetasqrd(self):
+        r"""
+        Derive :math:`p_z(\cos\beta,\varphi)` and solve it for :math:`\cos^2\beta`,
+        returning the equation and the list of candidate solutions.
+
+        The solve step dominates the wall time of :meth:`define_idtx_fgtx_eqns`
+        and is disk-cached, so downstream root-picking and equation assembly
+        can be reworked without redoing it.
+        """
+        eta_sub = {eta: self.eta}
+        # eta is resolved in the first substitution so every later step in the
+        #   chain operates on the collapsed form
+        pz_cosbeta_varphi_tmp_eqn = ( self.pz_p_beta_eqn
+         .subs({p:self.p_varphi_beta_eqn.rhs.xreplace(eta_sub)})
+         .subs({varphi_r:varphi})
+         .subs({Abs(tan(beta)):Abs(sin(beta))/Abs(cos(beta))})
+         .subs({Abs(cos(beta)):cos(beta), Abs(sin(beta)):sin(beta)})
+         .subs({sin(beta):sqrt(1-cos(beta)**2)})
+        )
+        pz_cosbeta_varphi_eqn = Eq( pz_cosbeta_varphi_tmp_eqn.lhs**self.eta_dbldenom,
+                                    pz_cosbeta_varphi_tmp_eqn.rhs**self.eta_dbldenom )
+        # Treat the equation as a univariate polynomial in c = cos(beta)**2 and go
+        #   straight to the specialized root-finder; fall back to the general
+        #   solver if the form turns out not to be polynomial in c
+        c_ = sy.Symbol('c_cossqrdbeta', positive=True)
+        eqn_c = pz_cosbeta_varphi_eqn.subs({cos(beta)**2: c_})
+        try:
+            poly_c = sy.Poly(eqn_c.lhs - eqn_c.rhs, c_)
+            cosbetasqrd_pz_varphi_solns \
+                = list(_cached_sym_op('roots', sy.roots, poly_c).keys())
+        except sy.PolynomialError:
+            cosbetasqrd_pz_varphi_solns = None
+        if not cosbetasqrd_pz_varphi_solns:
+            cosbetasqrd_pz_varphi_solns = _cached_solve( pz_cosbeta_varphi_eqn, cos(beta)**2 )
+        return pz_cosbeta_varphi_eqn, cosbetasqrd_pz_varphi_solns
+
+
+    def _pick_cosbetasqrd_root(self):
+        r"""
+        Select the physical (real, non-negative) :math:`\cos^2\beta` candidates
+        from :attr:`cosbetasqrd_pz_varphi_solns`.
+        """
+        # Probe all the candidate roots numerically in one vector-valued
+        #   lambdified call rather than substituting and taking im/re
+        #   symbolically per candidate per test
+        probe_fn = lambdify((varphi, pz), Matrix(self.cosbetasqrd_pz_varphi_solns),
+                            modules='mpmath')
         def find_cosbetasqrd_root(sub):
-            return [ soln for soln in self.cosbetasqrd_pz_varphi_solns
-                                                     if Abs(im(sy.N(soln.subs(sub))))<1e-20
-                                                     and (re(sy.N(soln.subs(sub))))>=0 ]
-        self.cosbetasqrd_pz_varphi_soln = find_cosbetasqrd_root({varphi:1,pz:-0.01})
-        if self.cosbetasqrd_pz_varphi_soln==[]:
-            self.cosbetasqrd_pz_varphi_soln = find_cosbetasqrd_root({varphi:10,pz:-0.5})
-        self.fgtx_cossqrdbeta_pz_varphi_eqn = Eq(cos(beta)**2, self.cosbetasqrd_pz_varphi_soln[0])
-        self.fgtx_tanbeta_pz_varphi_eqn = Eq( tan(beta),
-                                sqrt(1/(self.fgtx_cossqrdbeta_pz_varphi_eqn.rhs)-1) )
-        self.fgtx_px_pz_varphi_eqn = factor( Eq(px, -pz*self.fgtx_tanbeta_pz_varphi_eqn.rhs ) )
-        g_xx = self.gstar_varphi_pxpz_eqn.rhs[0,0]
-        g_zx = self.gstar_varphi_pxpz_eqn.rhs[1,0]
-        g_xz = self.gstar_varphi_pxpz_eqn.rhs[0,1]
-        g_zz = self.gstar_varphi_pxpz_eqn.rhs[1,1]
-        self.idtx_rdotx_pz_varphi_eqn = factor(
-            Eq(rx, (g_xx*px+g_xz*pz).subs({px:self.fgtx_px_pz_varphi_eqn.rhs,varphi_r:varphi})) )
-        self.idtx_rdotz_pz_varphi_eqn = factor(factor(
-            Eq(rz, (g_zx*px+g_zz*pz).subs({px:self.fgtx_px_pz_varphi_eqn.rhs,varphi_r:varphi})) ))
+            try:
+                probes_ = [complex(probe_) for probe_ in probe_fn(sub[varphi], sub[pz])]
+            except Exception:
+                return []   # e.g. divide-by-zero at the probe point
+            return [soln for soln, probe_ in zip(self.cosbetasqrd_pz_varphi_solns, probes_)
+                    if abs(probe_.imag)<1e-20 and probe_.real>=0]
+        cosbetasqrd_pz_varphi_soln = find_cosbetasqrd_root({varphi:1,pz:-0.01})
+        if cosbetasqrd_pz_varphi_soln==[]:
+            cosbetasqrd_pz_varphi_soln = find_cosbetasqrd_root({varphi:10,pz:-0.5})
+        return cosbetasqrd_pz_varphi_soln
+
+
+    def _build_fgtx_eqns(self):
+        r"""
+        Assemble the figuratrix equations from the selected
+        :math:`\cos^2\beta` root.
+        """
+        fgtx_cossqrdbeta_pz_varphi_eqn = Eq(cos(beta)**2, self.cosbetasqrd_pz_varphi_soln[0])
+        fgtx_tanbeta_pz_varphi_eqn = Eq( tan(beta),
+                                sqrt(1/(fgtx_cossqrdbeta_pz_varphi_eqn.rhs)-1) )
+        fgtx_px_pz_varphi_eqn = _cached_factor( Eq(px, -pz*fgtx_tanbeta_pz_varphi_eqn.rhs ) )
+        return fgtx_cossqrdbeta_pz_varphi_eqn, fgtx_tanbeta_pz_varphi_eqn, fgtx_px_pz_varphi_eqn
+
+
+    def _build_idtx_eqns(self):
+        r"""
+        Assemble the indicatrix ray-velocity equations from the metric tensor
+        and the figuratrix :math:`p_x(p_z,\varphi)` root.
+        """
+        # Resolve varphi and the px root in the metric entries once: the
+        #   entries are themselves functions of px, so the root must go into
+        #   them as well as into the contraction with the covector
+        px_sub = {px: self.fgtx_px_pz_varphi_eqn.rhs}
+        g_xx, g_zx, g_xz, g_zz \
+            = [g_.xreplace({varphi_r:varphi}).xreplace(px_sub)
+               for g_ in (self.gstar_varphi_pxpz_eqn.rhs[0,0],
+                          self.gstar_varphi_pxpz_eqn.rhs[1,0],
+                          self.gstar_varphi_pxpz_eqn.rhs[0,1],
+                          self.gstar_varphi_pxpz_eqn.rhs[1,1])]
+        px_root = px_sub[px]
+        idtx_rdotx_pz_varphi_eqn = _cached_factor( Eq(rx, g_xx*px_root+g_xz*pz) )
+        idtx_rdotz_pz_varphi_eqn = _cached_factor( Eq(rz, g_zx*px_root+g_zz*pz) )
+        return idtx_rdotx_pz_varphi_eqn, idtx_rdotz_pz_varphi_eqn
 
 
     def prep_geodesic_eqns(self, parameters=None):
@@ -818,20 +1456,26 @@ class Equations:
         mu_eta_sub = {mu: self.mu, eta: self.eta}
 
         # if parameters is None: return
-        H_ = self.H_eqn.rhs.subs(mu_eta_sub)
+        H_ = self.H_eqn.rhs.xreplace(mu_eta_sub)
         # Assume indexing here ranges in [1,2]
         p_i_lambda = lambda i: [px, pz][i-1]
         r_i_lambda = lambda i: [rx, rz][i-1]
         rdot_i_lambda = lambda i: [rdotx, rdotz][i-1]
+        # Keep full simplify throughout this chain, not the cheaper cancel: the
+        #   sign-lossy beta->alpha identities below (sin/cos from tan via sqrt)
+        #   are branch-sensitive to the exact form they are applied to, and the
+        #   downstream metrics were validated against the simplify-normal forms
         gstar_ij_lambda = lambda i,j: simplify( Rational(2,2)*diff(diff(H_,p_i_lambda(i)),p_i_lambda(j)) )
         gstar_ij_mat = Matrix([[gstar_ij_lambda(1,1),gstar_ij_lambda(2,1)],
                                [gstar_ij_lambda(1,2),gstar_ij_lambda(2,2)]])
-        gstar_ij_pxpz_mat = gstar_ij_mat.subs({varphi_r:varphi_rx})
-        g_ij_pxpz_mat = gstar_ij_mat.inv().subs({varphi_r:varphi_rx})
+        gstar_ij_pxpz_mat = gstar_ij_mat.xreplace({varphi_r:varphi_rx})
+        g_ij_pxpz_mat = gstar_ij_mat.inv().xreplace({varphi_r:varphi_rx})
 
         # FIX THIS
-        self.gstar_ij_tanbeta_mat = simplify( gstar_ij_pxpz_mat.subs(e2d(self.px_pz_tanbeta_eqn)) )
-        self.g_ij_tanbeta_mat = simplify( g_ij_pxpz_mat.subs(e2d(self.px_pz_tanbeta_eqn)) )
+        self.gstar_ij_tanbeta_mat \
+            = simplify( gstar_ij_pxpz_mat.subs(self._sub(self.px_pz_tanbeta_eqn)) )
+        self.g_ij_tanbeta_mat \
+            = simplify( g_ij_pxpz_mat.subs(self._sub(self.px_pz_tanbeta_eqn)) )
 
         # HACK!!!   These choices of solutions should not be hardwired but should be dependent
         #           on a search for the real, non-zero solution
@@ -845,44 +1489,48 @@ class Equations:
         # tanbeta_eqn = Eq(tan(beta),simplify( solve(tb_poly_eqn, tb)[0] ))
         # tan2beta_eqn = Eq(tan(beta)**2,simplify( solve(tb_poly_eqn, tb**2)[1] ))
 
-        tanalpha_beta_eqn = self.tanalpha_beta_eqn.subs(mu_eta_sub)
-        tanbeta_poly_eqn = Eq(
-            sy.numer(tanalpha_beta_eqn.rhs) - tanalpha_beta_eqn.lhs*sy.denom(tanalpha_beta_eqn.rhs), 0) \
-                                        .subs({tan(alpha):ta})
+        # Fold the tan(alpha) -> a shorthand into the same traversal as the
+        #   mu/eta substitution rather than a separate pass over the polynomial
+        tanalpha_beta_eqn = self.tanalpha_beta_eqn.xreplace({**mu_eta_sub, tan(alpha):ta})
+        # One as_numer_denom() traversal instead of separate numer/denom calls
+        numer_, denom_ = tanalpha_beta_eqn.rhs.as_numer_denom()
+        tanbeta_poly_eqn = Eq(numer_ - tanalpha_beta_eqn.lhs*denom_, 0)
 
         # HACK!!!  which of the (?) two roots should be chosen?
-        tanbeta_eqn  = (Eq(tan(beta), solve(tanbeta_poly_eqn, tan(beta))[0]))
+        # Stick with solve()'s ordering here: everything downstream of
+        #   tanbeta_eqn was validated against solve(...)[0], and the roots
+        #   returned symbolically carry is_real=None so no filter can pin
+        #   the branch without numeric coefficients
+        tanbeta_solns = _cached_solve(tanbeta_poly_eqn, tan(beta))
+        tanbeta_eqn  = (Eq(tan(beta), tanbeta_solns[0]))
         self.tanbeta_poly_eqn = tanbeta_poly_eqn
         self.tanbeta_eqn = tanbeta_eqn
-        cosbeta_eqn = Eq(cos(beta), 1/sqrt(1+tan(beta)**2))
-        sinbeta_eqn = Eq(sin(beta), sqrt(1-1/(1+tan(beta)**2)))
-        sintwobeta_eqn = Eq(sin(2*beta), cos(beta)**2-sin(beta)**2)
 
+        # mu and eta were already resolved in H_ and tanalpha_beta_eqn above,
+        #   so resolve them in the varphi model here too and the trailing
+        #   .subs(mu_eta_sub) passes become no-ops and are dropped; the
+        #   remaining keys are all bare symbols or exact subtrees, so the
+        #   hash-based xreplace suffices in place of pattern-matching subs
+        varphi_rx_sub = e2d(self.varphi_rx_eqn.xreplace({varphi_r:varphi_rx}).xreplace(mu_eta_sub))
+        # Fuse the beta->alpha substitutions into one dict whose values are
+        #   pre-resolved through the later replacements, so a single hash-based
+        #   xreplace pass is equivalent to the old four-pass subs chain
+        beta_to_alpha_sub = {}
+        for eqn_ in (tanbeta_eqn, _cosbeta_eqn, _sinbeta_eqn, _sintwobeta_eqn):
+            beta_to_alpha_sub[eqn_.lhs] = eqn_.rhs.xreplace(beta_to_alpha_sub)
         # Replace all refs to beta with refs to alpha
-        self.gstar_ij_tanalpha_mat = ( self.gstar_ij_tanbeta_mat
-                                        .subs(e2d(sintwobeta_eqn))
-                                        .subs(e2d(sinbeta_eqn))
-                                        .subs(e2d(cosbeta_eqn))
-                                        .subs(e2d(tanbeta_eqn))
-                                        ).subs(mu_eta_sub)
+        self.gstar_ij_tanalpha_mat = self.gstar_ij_tanbeta_mat.xreplace(beta_to_alpha_sub)
         # Use tan(alpha) equation instead of hardwired sub here
         self.gstar_ij_mat = ( self.gstar_ij_tanalpha_mat
-                                        .subs({ta:rdotz/rdotx})
-                                        .subs(e2d(self.varphi_rx_eqn.subs({varphi_r:varphi_rx})))
-                                        .subs(parameters) ).subs(mu_eta_sub)
-        self.g_ij_tanalpha_mat = ( self.g_ij_tanbeta_mat
-                                        .subs(e2d(sintwobeta_eqn))
-                                        .subs(e2d(sinbeta_eqn))
-                                        .subs(e2d(cosbeta_eqn))
-                                        .subs(e2d(tanbeta_eqn))
-                                        ).subs(mu_eta_sub)
+                                        .xreplace({ta:rdotz/rdotx, **varphi_rx_sub})
+                                        .subs(parameters) )
+        self.g_ij_tanalpha_mat = self.g_ij_tanbeta_mat.xreplace(beta_to_alpha_sub)
         self.g_ij_mat = ( self.g_ij_tanalpha_mat
-                                        .subs({ta:rdotz/rdotx})
-                                        .subs(e2d(self.varphi_rx_eqn.subs({varphi_r:varphi_rx})))
-                                        .subs(parameters) ).subs(mu_eta_sub)
+                                        .xreplace({ta:rdotz/rdotx, **varphi_rx_sub})
+                                        .subs(parameters) )
         # return self.g_ij_mat
-        self.g_ij_mat_lambdified = lambdify( (rx,rdotx,rdotz, varepsilon), self.g_ij_mat, 'numpy')
-        self.gstar_ij_mat_lambdified = lambdify( (rx,rdotx,rdotz, varepsilon), self.gstar_ij_mat, 'numpy')
+        self.g_ij_mat_lambdified = self._lambdify_metric_mat( self.g_ij_mat )
+        self.gstar_ij_mat_lambdified = self._lambdify_metric_mat( self.gstar_ij_mat )
 
 
     def define_geodesic_eqns(self, parameters=None):
@@ -918,6 +1566,17 @@ class Equations:
                 lambdified version of :math:`\dot{v}^x`
             vdotz_lambdified   (function) :
                 lambdified version of :math:`\dot{v}^z`
+            vdotx_ufunc   (function) :
+                C-compiled (:func:`ufuncify <sympy.utilities.autowrap.ufuncify>`) version of :math:`\dot{v}^x`,
+                compiled lazily on first access if a compiler is available;
+                otherwise an alias for `vdotx_lambdified`
+            vdotz_ufunc   (function) :
+                C-compiled version of :math:`\dot{v}^z`, likewise
+            jac_lambdified   (function) :
+                lambdified Jacobian :math:`\partial(\dot{v}^x,\dot{v}^z)/\partial(r^x,v^x,v^z)`
+                of the acceleration components: the non-trivial block from which
+                the full state-system Jacobian required by implicit :mod:`scipy`
+                integrators can be assembled
         """
         self.dg_rk_ij_mat = None
         self.christoffel_ij_k_rx_rdot_lambda = None
@@ -925,34 +1584,68 @@ class Equations:
         self.geodesic_eqns = None
         self.vdotx_lambdified = None
         self.vdotz_lambdified = None
+        self.jac_lambdified = None
         if self.eta>=1 and self.beta_type=='sin':
             print(r'Cannot compute geodesic equations for $\sin\beta$ model and $\eta>=1$')
             return
         eta_sub = {eta: self.eta}
 
         # Manipulate metric tensors
-        gstar_ij_lambda = lambda i_,j_: self.gstar_ij_mat[i_,j_]
-        g_ij_lambda = lambda i_,j_: self.g_ij_mat[i_,j_]
+        # Materialize the contravariant metric as a plain nested list: the
+        #   Christoffel assembly below indexes it repeatedly, and list lookups
+        #   skip the per-call attribute and Matrix __getitem__ overhead
+        gstar_flat = [[self.gstar_ij_mat[i_,j_] for j_ in (0,1)] for i_ in (0,1)]
         r_k_mat = Matrix([rx, rz])
-        self.dg_rk_ij_mat = (derive_by_array(self.g_ij_mat,r_k_mat))
-        dg_ij_rk_lambda = lambda i_,j_,k_: self.dg_rk_ij_mat[k_,0,i_,j_]
+        # The metric is symmetric, so differentiate each distinct entry once
+        #   and mirror it into the (j,i) slot rather than letting
+        #   derive_by_array walk all four entries per coordinate
+        dg_entry_cache = {}
+        def dg_entry(k_, i_, j_):
+            key_ = (k_, min(i_,j_), max(i_,j_))
+            if key_ not in dg_entry_cache:
+                dg_entry_cache[key_] = diff(self.g_ij_mat[key_[1],key_[2]], r_k_mat[k_,0])
+            return dg_entry_cache[key_]
+        # Same (2,1,2,2) layout as derive_by_array(g_ij_mat, r_k_mat), in
+        #   immutable form for cheap repeated indexing
+        self.dg_rk_ij_mat = sy.ImmutableDenseNDimArray(
+            [[[[dg_entry(k_,i_,j_) for j_ in [0,1]]
+                                   for i_ in [0,1]]]
+                                   for k_ in [0,1]] )
+        # Nested-list view of the same entries, with dg_flat[k][i][j]
+        #   standing for d(g_ij)/d(r^k)
+        dg_flat = [[[dg_entry(k_,i_,j_) for j_ in (0,1)]
+                                        for i_ in (0,1)]
+                                        for k_ in (0,1)]
 
         # Generate Christoffel "symbols" tensor
         christoffel_ij_k_raw = lambda i_,j_,k_: [
-                                        Rational(1,2)*gstar_ij_lambda(k_,m_)*(
-                                          dg_ij_rk_lambda(m_,i_,j_)
-                                        + dg_ij_rk_lambda(m_,j_,i_)
-                                        - dg_ij_rk_lambda(i_,j_,m_))
+                                        Rational(1,2)*gstar_flat[k_][m_]*(
+                                          dg_flat[j_][m_][i_]
+                                        + dg_flat[i_][m_][j_]
+                                        - dg_flat[m_][i_][j_])
                                     for m_ in [0,1] ]
         # Use of 'factor' here messes things up for eta<1
-        self.christoffel_ij_k_rx_rdot_lambda = lambda i_,j_,k_: \
-            (reduce(lambda a,b: a+b, christoffel_ij_k_raw(i_,j_,k_)))
-        christoffel_ij_k_rx_rdot_list = [[[
-            lambdify( (rx, rdotx, rdotz, varepsilon), self.christoffel_ij_k_rx_rdot_lambda(i_,j_,k_) )
-                                               for i_ in [0,1]]
-                                              for j_ in [0,1]]
-                                             for k_ in [0,1]]
-        self.christoffel_ij_k_lambda = lambda i_,j_,k_, varepsilon_: christoffel_ij_k_rx_rdot_list[i_][j_][k_]
+        # Gamma_ij^k is symmetric in (i,j), so canonicalize the index pair and
+        #   build each distinct component only once, halving the diff work
+        christoffel_ij_k_cache = {}
+        def christoffel_ij_k_rx_rdot(i_,j_,k_):
+            key_ = (min(i_,j_), max(i_,j_), k_)
+            if key_ not in christoffel_ij_k_cache:
+                # Flat Add: one canonicalization instead of a pairwise fold
+                christoffel_ij_k_cache[key_] = sy.Add(*christoffel_ij_k_raw(*key_))
+            return christoffel_ij_k_cache[key_]
+        self.christoffel_ij_k_rx_rdot_lambda = christoffel_ij_k_rx_rdot
+        # Lambdify all eight Christoffel coefficients as one vector-valued
+        #   function so their many shared subexpressions are compiled (and
+        #   cse'd) once, rather than re-emitted per entry
+        christoffel_mat = Matrix([self.christoffel_ij_k_rx_rdot_lambda(i_,j_,k_)
+                                  for k_ in [0,1] for j_ in [0,1] for i_ in [0,1]])
+        self._christoffel_lambdified = self.lambdify( christoffel_mat, (rx, rdotx, rdotz, varepsilon) )
+        christoffel_entry_lambda = lambda idx_: ( lambda rx_, rdotx_, rdotz_, varepsilon_:
+            self._christoffel_lambdified(rx_, rdotx_, rdotz_, varepsilon_)[idx_,0] )
+        # Index order matches the nested-list layout this replaces
+        self.christoffel_ij_k_lambda = lambda i_,j_,k_, varepsilon_: \
+            christoffel_entry_lambda(k_ + 2*j_ + 4*i_)
 
         # Obtain geodesic equations as a set of coupled 1st order ODEs
         self.geodesic_eqns = Matrix([
@@ -970,8 +1663,80 @@ class Equations:
                        -self.christoffel_ij_k_rx_rdot_lambda(1,1,1)*rdotz*rdotz) )
         ])
         # Use of 'factor' here messes things up for eta<1
-        self.vdotx_lambdified = sy.lambdify( (rx, rdotx,rdotz, varepsilon), (self.geodesic_eqns[2].rhs), 'numpy')
-        self.vdotz_lambdified = sy.lambdify( (rx, rdotx,rdotz, varepsilon), (self.geodesic_eqns[3].rhs), 'numpy')
+        # Horner-form (in rx) copies of the acceleration RHS for all the code
+        #   generation below: fewer multiplies and adds than expanded powers
+        vdotx_rhs_ = _hornerize(sy.together(self.geodesic_eqns[2].rhs), rx)
+        vdotz_rhs_ = _hornerize(sy.together(self.geodesic_eqns[3].rhs), rx)
+        # One fused lambdify for both acceleration components: they share most
+        #   of their Christoffel subexpressions, which cse emits only once
+        self._vdot_lambdified = self.lambdify( Matrix([vdotx_rhs_,
+                                                       vdotz_rhs_]).applyfunc(_expand_small_powers),
+                                               (rx, rdotx,rdotz, varepsilon) )
+        # These are the ODE RHS callables invoked per integration step, so JIT
+        #   them with numba when available; scalar 'math' lambdifications trace
+        #   cleanly in numba, whereas the fused matrix version does not
+        try:
+            from numba import njit
+            # The explicit signature forces eager compilation, so anything
+            #   numba cannot type fails here and takes the fallback below
+            #   instead of erroring on the first integration step
+            self.vdotx_lambdified = njit('float64(float64,float64,float64,float64)',
+                                         fastmath=True)( lambdify(
+                (rx, rdotx, rdotz, varepsilon), _expand_small_powers(vdotx_rhs_.evalf()),
+                modules='math', cse=True) )
+            self.vdotz_lambdified = njit('float64(float64,float64,float64,float64)',
+                                         fastmath=True)( lambdify(
+                (rx, rdotx, rdotz, varepsilon), _expand_small_powers(vdotz_rhs_.evalf()),
+                modules='math', cse=True) )
+        except Exception:
+            self.vdotx_lambdified = lambda rx_, rdotx_, rdotz_, varepsilon_: \
+                self._vdot_lambdified(rx_, rdotx_, rdotz_, varepsilon_)[0,0]
+            self.vdotz_lambdified = lambda rx_, rdotx_, rdotz_, varepsilon_: \
+                self._vdot_lambdified(rx_, rdotx_, rdotz_, varepsilon_)[1,0]
+        # Analytic Jacobian of the acceleration RHS w.r.t. (rx, vx, vz), so
+        #   implicit/stiff integrators need not estimate it by extra RHS calls
+        self.jac_lambdified = self.lambdify(
+            Matrix([vdotx_rhs_, vdotz_rhs_]).jacobian([rx, rdotx, rdotz])
+                                            .applyfunc(_expand_small_powers),
+            (rx, rdotx,rdotz, varepsilon) )
+        # Stash the acceleration RHS for the C-compiled ufunc versions, which
+        #   are built lazily on first access to vdotx_ufunc/vdotz_ufunc: the
+        #   compilation invokes a C toolchain, so don't pay for it here when
+        #   most callers only ever use the lambdified/njit versions
+        self._vdot_ufunc_exprs = (vdotx_rhs_.evalf(), vdotz_rhs_.evalf())
+
+    @property
+    def vdotx_ufunc(self):
+        r"""C-compiled ufunc version of :math:`\dot{v}^x` (built on first access)"""
+        return self._build_vdot_ufuncs()[0]
+
+    @property
+    def vdotz_ufunc(self):
+        r"""C-compiled ufunc version of :math:`\dot{v}^z` (built on first access)"""
+        return self._build_vdot_ufuncs()[1]
+
+    def _build_vdot_ufuncs(self):
+        r"""
+        Compile :func:`ufuncify <sympy.utilities.autowrap.ufuncify>` versions of the
+        ray acceleration components for the tightest integration loops, falling back
+        to the lambdified versions if no compiler is present (or if the geodesic
+        equations weren't derivable for this model).
+        """
+        if getattr(self, '_vdot_ufuncs', None) is None:
+            if getattr(self, '_vdot_ufunc_exprs', None) is None:
+                self._vdot_ufuncs = (self.vdotx_lambdified, self.vdotz_lambdified)
+                return self._vdot_ufuncs
+            vdotx_expr_, vdotz_expr_ = self._vdot_ufunc_exprs
+            try:
+                from sympy.utilities.autowrap import ufuncify
+                self._vdot_ufuncs = (
+                    ufuncify( (rx, rdotx, rdotz, varepsilon), vdotx_expr_,
+                              backend='cython' ),
+                    ufuncify( (rx, rdotx, rdotz, varepsilon), vdotz_expr_,
+                              backend='cython' ) )
+            except Exception:
+                self._vdot_ufuncs = (self.vdotx_lambdified, self.vdotz_lambdified)
+        return self._vdot_ufuncs
 
 
     def define_px_poly_eqn(self, eta_choice=None):
@@ -1005,7 +1770,7 @@ class Equations:
             self.poly_px_xiv_varphi_eqn = poly( tmp_eqn.lhs, px)
         else:
             self.poly_px_xiv_varphi_eqn = poly(numer(tmp_eqn.lhs), px)
-        self.poly_px_xiv0_eqn = Eq(self.poly_px_xiv_varphi_eqn.subs(e2d(self.varphi_rx_eqn)) \
+        self.poly_px_xiv0_eqn = Eq(self.poly_px_xiv_varphi_eqn.subs(self._sub(self.varphi_rx_eqn)) \
                                                               .subs({xiv:xiv_0}), 0)
 
 
@@ -1047,17 +1812,7 @@ class Equations:
 
                     'gradh': :math:`\dfrac{d}{d x} h{\left(x \right)} = \dfrac{\kappa_\mathrm{h} h_{0} \left(1 - \tanh^{2}{\left(\dfrac{\kappa_\mathrm{h} x}{x_{1}} - \kappa_\mathrm{h} \right)}\right)}{x_{1} \tanh{\left(\dfrac{\kappa_\mathrm{h}}{x_{1}} \right)}}`
         """
-        self.boundary_eqns = {
-            'planar' : {'h': Eq(h, (h_0*x/x_1))},
-            'convex-up' : {'h': simplify(Eq(h, h_0*sy.tanh(kappa_h*x/x_1)/sy.tanh(kappa_h/x_1)))},
-            'concave-up' : {'h': simplify(Eq(h, h_0+h_0*sy.tanh(-kappa_h*(x_1-x)/x_1)/sy.tanh(kappa_h/x_1)))}
-        }
-        # Math concave-up not geo concave-up, i.e., with minimum
-        # Math convex-up not geo convex-up, i.e., with maximum
-        for ibc_type in ['planar','convex-up','concave-up']:
-            self.boundary_eqns[ibc_type].update({
-                'gradh': Eq(diff(h_fn,x),diff(self.boundary_eqns[ibc_type]['h'].rhs,x))
-                })
+        self.boundary_eqns = _boundary_eqns()
 
 
     def set_ibc_eqns(self):
@@ -1076,25 +1831,21 @@ class Equations:
             pz_initial_eqn   (:class:`sympy.Eq <sympy.core.relational.Equality>`) :
                 :math:`p_{z} = - \dfrac{x_{1}^{2 \mu + 1} \left(\dfrac{1}{\kappa_\mathrm{h} h_{0} \left|{\tanh^{2}{\left(\frac{\kappa_\mathrm{h} x}{x_{1}} \right)} - 1}\right|}\right)^{\eta} \left(\kappa_\mathrm{h}^{2} h_{0}^{2} \left(\tanh^{2}{\left(\frac{\kappa_\mathrm{h} x}{x_{1}} \right)} - 1\right)^{2} + x_{1}^{2} \tanh^{2}{\left(\frac{\kappa_\mathrm{h}}{x_{1}} \right)}\right)^{\frac{\eta}{2} - \frac{1}{2}} \tanh{\left(\frac{\kappa_\mathrm{h}}{x_{1}} \right)}}{\varphi_0 \left(\varepsilon x_{1}^{2 \mu} + \left(- x + x_{1}\right)^{2 \mu}\right)}`
         """
-        cosbeta_eqn = Eq(cos(beta), 1/sqrt(1+tan(beta)**2))
-        sinbeta_eqn = Eq(sin(beta), sqrt(1-1/(1+tan(beta)**2)))
-        sintwobeta_eqn = Eq(sin(2*beta), cos(beta)**2-sin(beta)**2)
-
         ibc_type = self.ibc_type
-        self.rz_initial_eqn = self.boundary_eqns[ibc_type]['h'].subs({h:rz, x:rx})
+        self.rz_initial_eqn = self.boundary_eqns[ibc_type]['h'].xreplace({h:rz, x:rx})
         self.tanbeta_initial_eqn = Eq(tan(beta), self.boundary_eqns[ibc_type]['gradh'].rhs)
         self.p_initial_eqn = simplify( self.p_varphi_beta_eqn
-                                  .subs(e2d(self.varphi_rx_eqn))
+                                  .xreplace(self._sub(self.varphi_rx_eqn))
                                   # .subs({varphi_r:self.varphi_rx_eqn.rhs})
-                                  .subs({self.tanbeta_initial_eqn.lhs: self.tanbeta_initial_eqn.rhs})
-                                  .subs({rx:x}) )
+                                  .xreplace({self.tanbeta_initial_eqn.lhs: self.tanbeta_initial_eqn.rhs})
+                                  .xreplace({rx:x}) )
+        # Fuse the sin/cos/tan(beta) substitutions into one dict whose values
+        #   are pre-resolved through the later replacements, so a single
+        #   hash-based xreplace pass replaces the old three-pass subs chain
+        beta_initial_sub = {tan(beta): self.tanbeta_initial_eqn.rhs, rx: x}
+        for eqn_ in (_cosbeta_eqn, _sinbeta_eqn):
+            beta_initial_sub[eqn_.lhs] = eqn_.rhs.xreplace(beta_initial_sub)
         self.px_initial_eqn = Eq(px, simplify(
-            (+self.p_initial_eqn.rhs*sin(beta))
-            .subs(e2d(sinbeta_eqn))
-            .subs(e2d(cosbeta_eqn))
-            .subs({tan(beta):self.tanbeta_initial_eqn.rhs, rx:x})) )
+            (+self.p_initial_eqn.rhs*sin(beta)).xreplace(beta_initial_sub)) )
         self.pz_initial_eqn = Eq(pz, simplify(
-            (-self.p_initial_eqn.rhs*cos(beta))
-            .subs(e2d(sinbeta_eqn))
-            .subs(e2d(cosbeta_eqn))
-            .subs({tan(beta):self.tanbeta_initial_eqn.rhs, rx:x})) )
+            (-self.p_initial_eqn.rhs*cos(beta)).xreplace(beta_initial_sub)) )
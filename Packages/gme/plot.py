@@ -699,9 +699,12 @@ class OneRayPlots(Graphing):
                         and gmeq.vdotx_lambdified is not None and gmeq.vdotz_lambdified is not None:
             vx_array = gmes.rdotx_interp(x_array)
             vz_array = gmes.rdotz_interp(x_array)
-            vdotx_gdsc_array = np.array([gmeq.vdotx_lambdified(float(x), float(vx), float(vz), varepsilon.subs(sub))/xi_norm
+            # Coerce to a plain float: the vdot callables may be numba-compiled
+            #   and cannot type a SymPy Float argument
+            varepsilon_ = float(varepsilon.subs(sub))
+            vdotx_gdsc_array = np.array([gmeq.vdotx_lambdified(float(x), float(vx), float(vz), varepsilon_)/xi_norm
                                         for x,vx,vz in zip(x_array, vx_array, vz_array)])
-            vdotz_gdsc_array = np.array([gmeq.vdotz_lambdified(float(x), float(vx), float(vz), varepsilon.subs(sub))/xi_norm
+            vdotz_gdsc_array = np.array([gmeq.vdotz_lambdified(float(x), float(vx), float(vz), varepsilon_)/xi_norm
                                         for x,vx,vz in zip(x_array, vx_array, vz_array)])
             vdot_gdsc_array = np.sqrt(vdotx_gdsc_array**2+vdotz_gdsc_array**2)
             vdotx_label = r'$\dot{v}^x_\mathrm{gdsc}(x)$'+label_suffix
@@ -32,7 +32,10 @@ G2 = symbols('G2')
 p = symbols('p',  real=True, positive=True)
 p_0 = symbols('p_0',  real=True, positive=True)
 u = symbols('u',  real=True)
-px = symbols('p_x',  real=True)
+# The slowness covector component p_x is strictly positive in GME
+#   (rays only propagate in the +x direction); declaring it as such lets SymPy
+#   fold Abs(p_x)/sign(p_x) automatically during the equation derivations
+px = symbols('p_x',  real=True, positive=True)
 pz = symbols('p_z',  real=True, negative=True)
 pz_0 = symbols('p_{z_0}',  real=True)
 pxp = symbols('p_x^+',  real=True, positive=True)